@@ -14,6 +14,10 @@ class DriveCommand(BaseModel):
 
 @router.post("/drive")
 async def drive_rover(cmd: DriveCommand):
+    if state.estop["active"]:
+        # Latched e-stop: refuse motion until /api/estop/release
+        raise HTTPException(status_code=409, detail="Emergency stop active")
+
     try:
         # Store command for Pi to pick up
         state.set_command(cmd.x, cmd.y, cmd.speed)
@@ -0,0 +1,47 @@
+import asyncio
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+from backend.state.system_state import state
+
+router = APIRouter()
+
+class EStopAck(BaseModel):
+    id: int
+
+@router.post("/estop")
+async def emergency_stop():
+    """
+    Priority lane: latches an emergency stop and wakes the Pi's e-stop listener
+    immediately instead of waiting for the next drive poll.
+    """
+    return state.trigger_estop()
+
+@router.post("/estop/release")
+async def release_emergency_stop():
+    return state.release_estop()
+
+@router.get("/estop")
+async def get_emergency_stop():
+    return state.estop
+
+@router.get("/estop/wait")
+async def wait_emergency_stop(
+    since: int = Query(0, description="Last e-stop id the agent has seen"),
+    active: bool = Query(False, description="Whether the agent currently has the e-stop latched"),
+    timeout: float = Query(10.0, ge=0, le=30),
+):
+    """
+    Long-poll for the Pi Agent. Returns as soon as the e-stop state differs
+    from what the agent reported, or after `timeout` seconds.
+    """
+    if state.estop["id"] != since or state.estop["active"] != active:
+        return state.estop
+    try:
+        await asyncio.wait_for(state.estop_changed.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    return state.estop
+
+@router.post("/estop/ack")
+async def ack_emergency_stop(ack: EStopAck):
+    return state.ack_estop(ack.id)
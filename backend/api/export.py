@@ -0,0 +1,104 @@
+import io
+import csv
+import json
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Iterator, List, Optional
+from backend.state.system_state import state
+
+# Arrow is optional: CSV and NDJSON work without it
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+router = APIRouter()
+
+SENSOR_COLUMNS = ["ts", "metric", "value"]
+COMMAND_COLUMNS = ["ts", "x", "y", "speed"]
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+def encode_csv(batches: Iterator[List[tuple]], columns: List[str]) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    for rows in batches:
+        writer.writerows(rows)
+        yield buf.getvalue().encode()
+        buf.seek(0)
+        buf.truncate()
+    # Header only (empty export)
+    if buf.tell():
+        yield buf.getvalue().encode()
+
+def encode_ndjson(batches: Iterator[List[tuple]], columns: List[str]) -> Iterator[bytes]:
+    for rows in batches:
+        yield "".join(json.dumps(dict(zip(columns, row))) + "\n" for row in rows).encode()
+
+def encode_arrow(batches: Iterator[List[tuple]], columns: List[str], schema) -> Iterator[bytes]:
+    """Arrow IPC stream: one record batch per DB batch, drained after each write."""
+    sink = io.BytesIO()
+    writer = pa.ipc.new_stream(sink, schema)
+    for rows in batches:
+        arrays = [pa.array(col, type=schema.field(i).type) for i, col in enumerate(zip(*rows))]
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, names=columns))
+        yield sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+    writer.close()
+    yield sink.getvalue()
+
+def stream_export(name: str, fmt: str, batches, columns: List[str], arrow_types) -> StreamingResponse:
+    if fmt == "csv":
+        body = encode_csv(batches, columns)
+    elif fmt == "ndjson":
+        body = encode_ndjson(batches, columns)
+    else:
+        if pa is None:
+            raise HTTPException(status_code=501, detail="Arrow export requires pyarrow")
+        schema = pa.schema(list(zip(columns, arrow_types())))
+        body = encode_arrow(batches, columns, schema)
+
+    # No Content-Length -> chunked transfer; rows are read from disk as the client consumes them
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+@router.get("/export/sensors")
+async def export_sensors(
+    format: str = Query("csv", pattern="^(csv|ndjson|arrow)$"),
+    start: Optional[float] = Query(None, description="Unix timestamp (inclusive)"),
+    end: Optional[float] = Query(None, description="Unix timestamp (exclusive)"),
+    metrics: Optional[str] = Query(None, description="Comma-separated, e.g. soil.ph,environment"),
+):
+    """
+    Stream sensor history. Memory use stays flat regardless of export size.
+    """
+    metric_list = [m.strip() for m in metrics.split(",") if m.strip()] if metrics else None
+    batches = state.history.iter_sensor_readings(start, end, metric_list)
+    return stream_export(
+        "sensors", format, batches, SENSOR_COLUMNS,
+        lambda: [pa.float64(), pa.string(), pa.float64()],
+    )
+
+@router.get("/export/commands")
+async def export_commands(
+    format: str = Query("csv", pattern="^(csv|ndjson|arrow)$"),
+    start: Optional[float] = Query(None, description="Unix timestamp (inclusive)"),
+    end: Optional[float] = Query(None, description="Unix timestamp (exclusive)"),
+):
+    """
+    Stream drive command history.
+    """
+    batches = state.history.iter_commands(start, end)
+    return stream_export(
+        "commands", format, batches, COMMAND_COLUMNS,
+        lambda: [pa.float64(), pa.int64(), pa.int64(), pa.int64()],
+    )
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from typing import Any, Dict
 from backend.state.system_state import state
 
 router = APIRouter()
@@ -6,3 +7,12 @@ router = APIRouter()
 @router.get("/sensors")
 async def get_sensors():
     return state.get_sensors()
+
+@router.post("/sensors")
+async def post_sensors(readings: Dict[str, Any]):
+    """
+    Endpoint for the Pi Agent to push new readings.
+    Stored in history for /api/export.
+    """
+    state.update_sensors(readings)
+    return {"status": "ok"}
@@ -1,8 +1,24 @@
 from fastapi import APIRouter
+from pydantic import BaseModel, Field
+from typing import Optional
 from backend.state.system_state import state
 
 router = APIRouter()
 
+class BatteryReport(BaseModel):
+    level: Optional[float] = Field(..., ge=0, le=100, description="Estimated charge (%), null if not calibrated")
+    voltage: Optional[float] = Field(None, description="Pack voltage, if the Pi can measure it")
+    power_w: Optional[float] = Field(None, description="Current estimated draw (W)")
+    mode: Optional[str] = Field(None, description="Active power governor mode")
+
 @router.get("/status")
 async def get_status():
     return state.get_status()
+
+@router.post("/status/battery")
+async def report_battery(report: BatteryReport):
+    """
+    Endpoint for the Pi Agent to report its battery estimate.
+    """
+    state.update_battery(report.level, report.voltage, report.power_w, report.mode)
+    return {"status": "ok"}
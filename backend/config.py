@@ -29,4 +29,17 @@ class RoverConfig(BaseSettings):
     MAX_SPEED: int = 100
     WATCHDOG_TIMEOUT: float = 1.0
 
+    # Transport
+    # TCP stays up for the dashboard and remote Pi agents.
+    # The Unix socket lets an agent on the same host skip the TCP/IP stack.
+    # Set BACKEND_SOCKET to "" to disable it.
+    BACKEND_HOST: str = "0.0.0.0"
+    BACKEND_PORT: int = 8000
+    BACKEND_SOCKET: str = "/tmp/smartfield-backend.sock"
+
+    # History (sensor readings + drive commands, served by /api/export)
+    HISTORY_DB: str = "smartfield-history.db"
+    HISTORY_RETENTION_DAYS: float = 30.0  # Older rows are pruned; 0 keeps everything
+    HISTORY_PRUNE_INTERVAL: float = 3600.0
+
 config = RoverConfig()
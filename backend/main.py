@@ -8,7 +8,8 @@ import os
 # This fixes "ModuleNotFoundError" when running from inside the backend/ directory
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from backend.api import control, sensors, suggestions, status
+from backend.api import control, sensors, suggestions, status, export, estop
+from backend.config import config
 
 app = FastAPI(title="SmartFarm Rover Backend")
 
@@ -26,6 +27,8 @@ app.include_router(control.router, prefix="/api", tags=["Control"])
 app.include_router(sensors.router, prefix="/api", tags=["Sensors"])
 app.include_router(suggestions.router, prefix="/api", tags=["Suggestions"])
 app.include_router(status.router, prefix="/api", tags=["Status"])
+app.include_router(export.router, prefix="/api", tags=["Export"])
+app.include_router(estop.router, prefix="/api", tags=["Emergency Stop"])
 
 import logging
 # Configure logging to show INFO level logs in console
@@ -41,6 +44,41 @@ async def startup_event():
 async def root():
     return {"message": "SmartFarm Rover Backend Online"}
 
-if __name__ == "__main__":
+def _remove_stale_socket(path):
+    """Delete a socket file left behind by a backend that did not shut down cleanly."""
+    import socket
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise RuntimeError(f"Another backend is already listening on {path}")
+    finally:
+        probe.close()
+
+def serve():
+    """
+    Run one uvicorn server on TCP (dashboard, remote Pi) and, when the platform
+    supports it, on a Unix socket for a Pi agent running on the same host.
+    """
+    import socket
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+
+    tcp_config = uvicorn.Config(app, host=config.BACKEND_HOST, port=config.BACKEND_PORT)
+    sockets = [tcp_config.bind_socket()]
+
+    if config.BACKEND_SOCKET and hasattr(socket, "AF_UNIX"):
+        _remove_stale_socket(config.BACKEND_SOCKET)
+        sockets.append(uvicorn.Config(app, uds=config.BACKEND_SOCKET).bind_socket())
+
+    try:
+        uvicorn.Server(tcp_config).run(sockets=sockets)
+    finally:
+        if len(sockets) > 1 and os.path.exists(config.BACKEND_SOCKET):
+            os.unlink(config.BACKEND_SOCKET)
+
+if __name__ == "__main__":
+    serve()
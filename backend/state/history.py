@@ -0,0 +1,200 @@
+import time
+import queue
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+class HistoryStore:
+    """
+    History of sensor readings and drive commands.
+
+    Backed by SQLite on disk so history survives restarts and exports can
+    walk millions of rows with a cursor instead of holding them in memory.
+    Sensor readings are stored one metric per row ("soil.moisture", ...)
+    so exports can filter by metric without knowing the payload shape.
+
+    Writes from request handlers are queued and committed in batches by a
+    background thread, so the event loop never waits on the SD card. The
+    same thread prunes rows older than the retention window.
+    """
+    QUEUE_SIZE = 10000   # Pending writes before new ones are dropped
+    BATCH_SIZE = 500     # Queued writes per commit
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS sensor_readings (
+            ts REAL NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_sensor_readings_ts ON sensor_readings (ts);
+        CREATE TABLE IF NOT EXISTS commands (
+            ts REAL NOT NULL,
+            x INTEGER NOT NULL,
+            y INTEGER NOT NULL,
+            speed INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_commands_ts ON commands (ts);
+    """
+
+    def __init__(self, path: str, retention_days: float = 0, prune_interval: float = 3600.0):
+        self.path = path
+        self.retention_days = retention_days  # 0 keeps everything
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._conn.executescript(self.SCHEMA)
+
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._write_loop, name="history-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Readers and the writer use separate connections. WAL lets an export
+        # read a consistent snapshot while the rover keeps writing.
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # No fsync per 20Hz command on the SD card
+        return conn
+
+    # --- Writes ---
+
+    def record_command(self, ts: float, x: int, y: int, speed: int):
+        """Queue a command row. Never blocks."""
+        self._enqueue("commands", [(ts, x, y, speed)])
+
+    def record_sensors(self, ts: float, sensors: Dict[str, Any]):
+        """Queue one row per numeric metric. Never blocks."""
+        rows = [(ts, metric, value) for metric, value in flatten_metrics(sensors)]
+        if rows:
+            self._enqueue("sensor_readings", rows)
+
+    def import_sensor_rows(self, rows: Iterable[Tuple[float, str, float]]):
+        """
+        Synchronous bulk insert of (ts, metric, value) rows, including generators.
+        For offline imports and tests; do not call from a request handler.
+        """
+        with self._lock:
+            self._conn.executemany("INSERT INTO sensor_readings VALUES (?, ?, ?)", rows)
+            self._conn.commit()
+
+    def flush(self):
+        """Wait until every queued write is committed."""
+        self._queue.join()
+
+    def prune(self, now: float = None):
+        """Delete rows older than the retention window."""
+        if not self.retention_days:
+            return
+        cutoff = (time.time() if now is None else now) - self.retention_days * 86400
+        with self._lock:
+            for table in ("sensor_readings", "commands"):
+                self._conn.execute(f"DELETE FROM {table} WHERE ts < ?", (cutoff,))
+            self._conn.commit()
+
+    def _enqueue(self, table: str, rows: List[tuple]):
+        try:
+            self._queue.put_nowait((table, rows))
+        except queue.Full:
+            # Disk can't keep up: losing history beats stalling the rover
+            logging.warning(f"History queue full, dropping {len(rows)} {table} row(s)")
+
+    def _write_loop(self):
+        last_prune = 0.0
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                commands = [row for table, rows in batch if table == "commands" for row in rows]
+                readings = [row for table, rows in batch if table == "sensor_readings" for row in rows]
+                with self._lock:
+                    if commands:
+                        self._conn.executemany("INSERT INTO commands VALUES (?, ?, ?, ?)", commands)
+                    if readings:
+                        self._conn.executemany("INSERT INTO sensor_readings VALUES (?, ?, ?)", readings)
+                    self._conn.commit()
+
+                if time.time() - last_prune > self.prune_interval:
+                    self.prune()
+                    last_prune = time.time()
+            except sqlite3.Error as e:
+                logging.error(f"History write failed: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    # --- Streaming reads ---
+
+    def iter_sensor_readings(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        metrics: Optional[List[str]] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[Tuple[float, str, float]]]:
+        """
+        Yield batches of (ts, metric, value) rows ordered by time.
+        A metric filter matches exact names ("soil.ph") and groups ("soil").
+        """
+        where, params = self._time_filter(start, end)
+        if metrics:
+            clauses = []
+            for metric in metrics:
+                # Escape LIKE wildcards so "_" / "%" in a name match literally
+                escaped = metric.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                clauses.append("(metric = ? OR metric LIKE ? ESCAPE '\\')")
+                params.extend([metric, f"{escaped}.%"])
+            where.append("(" + " OR ".join(clauses) + ")")
+
+        query = "SELECT ts, metric, value FROM sensor_readings"
+        yield from self._iter_batches(query, where, params, batch_size)
+
+    def iter_commands(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[Tuple[float, int, int, int]]]:
+        """Yield batches of (ts, x, y, speed) rows ordered by time."""
+        where, params = self._time_filter(start, end)
+        query = "SELECT ts, x, y, speed FROM commands"
+        yield from self._iter_batches(query, where, params, batch_size)
+
+    def _time_filter(self, start, end):
+        where, params = [], []
+        if start is not None:
+            where.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            where.append("ts < ?")
+            params.append(end)
+        return where, params
+
+    def _iter_batches(self, query, where, params, batch_size):
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY ts"
+
+        conn = self._connect()
+        try:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            conn.close()
+
+def flatten_metrics(data: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """{"soil": {"ph": 5.6}} -> ("soil.ph", 5.6). Non-numeric values are skipped."""
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten_metrics(value, f"{name}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
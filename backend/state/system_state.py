@@ -1,5 +1,8 @@
+import asyncio
 from datetime import datetime
 from typing import Dict, Any
+from backend.config import config
+from backend.state.history import HistoryStore
 
 class SystemState:
     _instance = None
@@ -12,7 +15,8 @@ class SystemState:
 
     def initialize(self):
         self.connection_status = "online"
-        self.battery_level = 78  # Mock starting value
+        self.battery_level = None  # Unknown until the Pi reports a calibrated level
+        self.power_mode = None
         self.last_command_time = None
         self.sensors: Dict[str, Any] = {
             "soil": {
@@ -29,6 +33,14 @@ class SystemState:
             }
         }
         self.last_command = {"x": 0, "y": 0, "speed": 0, "ts": 0}
+        self.history = HistoryStore(
+            config.HISTORY_DB, config.HISTORY_RETENTION_DAYS, config.HISTORY_PRUNE_INTERVAL
+        )
+
+        # Emergency stop (latched until released). Kept apart from last_command
+        # so it never waits behind the agent's drive poll.
+        self.estop = {"id": 0, "active": False, "ts": 0, "acked_id": 0, "ack_ts": None, "latency_ms": None}
+        self.estop_changed = asyncio.Event()
 
     def set_command(self, x, y, speed):
         self.last_command = {
@@ -37,8 +49,60 @@ class SystemState:
             "speed": speed,
             "ts": datetime.now().timestamp()
         }
+        self.history.record_command(self.last_command["ts"], x, y, speed)
         self.update_last_command_time()
 
+    def update_sensors(self, sensors: Dict[str, Any]):
+        # Merge per group so a partial reading (e.g. soil only) keeps the rest
+        for group, values in sensors.items():
+            if isinstance(values, dict):
+                self.sensors.setdefault(group, {}).update(values)
+            else:
+                self.sensors[group] = values
+        self.history.record_sensors(datetime.now().timestamp(), sensors)
+
+    def trigger_estop(self):
+        self.estop.update({
+            "id": self.estop["id"] + 1,
+            "active": True,
+            "ts": datetime.now().timestamp(),
+            "ack_ts": None,
+            "latency_ms": None,
+        })
+        # Wake the listener before anything else touches state or history
+        self._notify_estop()
+        # Also zero the regular command so the normal path agrees once released
+        self.set_command(0, 0, 0)
+        return self.estop
+
+    def release_estop(self):
+        self.estop["active"] = False
+        self._notify_estop()
+        return self.estop
+
+    def ack_estop(self, estop_id: int):
+        """Agent confirms the motors are stopped. Latency = trigger -> ack received."""
+        if estop_id != self.estop["id"] or self.estop["acked_id"] == estop_id:
+            return self.estop
+        ack_ts = datetime.now().timestamp()
+        self.estop.update({
+            "acked_id": estop_id,
+            "ack_ts": ack_ts,
+            "latency_ms": round((ack_ts - self.estop["ts"]) * 1000, 2),
+        })
+        return self.estop
+
+    def _notify_estop(self):
+        # Wake every waiting listener, then arm a fresh event for the next change
+        self.estop_changed.set()
+        self.estop_changed = asyncio.Event()
+
+    def update_battery(self, level=None, voltage=None, power_w=None, mode=None):
+        self.battery_level = None if level is None else round(level)
+        self.power_mode = mode
+        reading = {"level": level, "voltage": voltage, "power_w": power_w}
+        self.history.record_sensors(datetime.now().timestamp(), {"battery": reading})
+
     def update_last_command_time(self):
         self.last_command_time = datetime.now()
 
@@ -60,6 +124,8 @@ class SystemState:
         return {
             "connection": self.connection_status,
             "battery": self.battery_level,
+            "powerMode": self.power_mode,
+            "estop": self.estop,
             "lastCommand": last_cmd_str
         }
 
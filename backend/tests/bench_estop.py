@@ -0,0 +1,136 @@
+import sys
+import os
+import time
+import tempfile
+import threading
+import statistics
+
+# Add project root to path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(ROOT)
+
+import requests
+from backend.tests.bench_transport import free_port, start_backend
+
+# pi_agent modules use flat imports (see pi_agent.py); add their directory
+# only after the pi_agent package is imported so pi_agent.py cannot shadow it
+sys.path.append(os.path.join(ROOT, "pi_agent"))
+from pi_agent.estop import EStopListener
+from pi_agent.transport import TransportError
+
+TRIALS = 50
+LOAD_THREADS = 8
+BOUND_MS = 100.0  # Stop-to-actuation must stay below this under load
+
+class RecordingRover:
+    """Stands in for RoverMotion: timestamps when the stop reaches the motors."""
+    def __init__(self):
+        self.stopped = threading.Event()
+        self.released = threading.Event()
+        self.stop_time = None
+
+    def emergency_stop(self):
+        self.stop_time = time.perf_counter()
+        self.stopped.set()
+
+    def release_emergency_stop(self):
+        self.released.set()
+
+def dashboard_load(base_url, running, counter):
+    """Synthetic dashboard traffic: joystick at 10Hz+ and status/sensor polling, flat out."""
+    session = requests.Session()
+    while running.is_set():
+        session.post(f"{base_url}/api/drive", json={"x": 10, "y": 50, "speed": 80})
+        session.get(f"{base_url}/api/sensors")
+        session.get(f"{base_url}/api/status")
+        session.get(f"{base_url}/api/suggestions")
+        counter.append(1)
+
+class FlakyTransport:
+    """Records POSTs; the first `failures` requests drop like a lost connection."""
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.posts = []
+
+    def request(self, method, path, payload=None):
+        if self.failures:
+            self.failures -= 1
+            raise TransportError("connection reset")
+        self.posts.append((path, payload))
+        return {}
+
+def test_ack_retry():
+    rover = RecordingRover()
+    listener = EStopListener(rover, "http://127.0.0.1:9", None)
+
+    try:
+        listener.handle({"id": 3, "active": True}, FlakyTransport(failures=1))
+        assert False, "Lost ack should surface so run() reconnects"
+    except TransportError:
+        pass
+    assert rover.stopped.is_set() and listener.pending_ack == 3
+
+    # After reconnecting, run() resends the ack before the next wait
+    transport = FlakyTransport()
+    listener.send_ack(transport)
+    assert transport.posts == [("/api/estop/ack", {"id": 3})]
+    assert listener.pending_ack is None
+    print("Lost e-stop ack is resent after reconnect")
+
+def test_estop():
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    socket_path = os.path.join(tempfile.mkdtemp(), "smartfield-bench.sock")
+    proc = start_backend(port, socket_path)
+
+    rover = RecordingRover()
+    listener = EStopListener(rover, base_url, socket_path)
+    listener.start()
+
+    running = threading.Event()
+    running.set()
+    counter = []
+    loaders = [threading.Thread(target=dashboard_load, args=(base_url, running, counter), daemon=True)
+               for _ in range(LOAD_THREADS)]
+    for t in loaders:
+        t.start()
+
+    session = requests.Session()
+    latencies = []
+    try:
+        time.sleep(1.0)  # let the load ramp up
+        load_start, load_requests = time.time(), len(counter)
+        for _ in range(TRIALS):
+            rover.stopped.clear()
+            rover.released.clear()
+
+            t0 = time.perf_counter()
+            session.post(f"{base_url}/api/estop")
+            assert rover.stopped.wait(2.0), "E-stop never reached the motors"
+            latencies.append((rover.stop_time - t0) * 1000)
+
+            session.post(f"{base_url}/api/estop/release")
+            assert rover.released.wait(2.0)
+            time.sleep(0.05)
+        load_rate = (len(counter) - load_requests) * 4 / (time.time() - load_start)
+
+        acked = session.get(f"{base_url}/api/estop").json()
+        assert acked["acked_id"] == acked["id"], "Last e-stop was not acknowledged"
+    finally:
+        running.clear()
+        for t in loaders:
+            t.join()
+        listener.stop()
+        proc.terminate()
+        proc.wait()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"Dashboard load: ~{load_rate:.0f} req/s from {LOAD_THREADS} clients")
+    print(f"Stop-to-actuation over {TRIALS} trials: median {statistics.median(latencies):.1f} ms   "
+          f"p99 {p99:.1f} ms   max {latencies[-1]:.1f} ms   (bound {BOUND_MS:.0f} ms)")
+    assert latencies[-1] < BOUND_MS
+
+if __name__ == "__main__":
+    test_ack_retry()
+    test_estop()
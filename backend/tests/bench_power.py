@@ -0,0 +1,68 @@
+import sys
+import os
+import logging
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+from pi_agent.rover.motion import RoverMotion
+from pi_agent.rover.power import EnergyEstimator, PowerGovernor, POWER_MODES
+
+# The governor changes the root log level; keep the console to mode changes only
+for handler in logging.getLogger().handlers:
+    handler.setLevel(logging.WARNING)
+
+def mission_command(t):
+    """
+    Repeating 60s field pattern: drive between sample points with turns,
+    creep into position, then sit idle while soil is sampled.
+    Returns (x, y, speed) as the dashboard would send it.
+    """
+    phase = t % 60
+    if phase < 30:
+        x = 60 if phase % 15 < 5 else 0
+        return x, 90, 100
+    if phase < 40:
+        return 0, 30, 100
+    return 0, 0, 0
+
+def simulate(modes):
+    """Run the agent loop on a simulated clock until the battery is empty."""
+    rover = RoverMotion()
+    energy = EnergyEstimator(now=0.0)
+    energy.reset()  # Fresh, fully charged pack
+    governor = PowerGovernor(rover, modes)
+
+    t = 0.0
+    distance = 0.0  # in "duty-seconds", proportional to ground covered
+    time_in_mode = {}
+    while energy.level > 0:
+        mode = governor.mode
+        x, y, speed = mission_command(t)
+        energy.record_poll()
+        rover.process_command(x, y, speed)
+
+        interval = mode.active_interval if (x or y) else mode.idle_interval
+        t += interval
+        distance += rover.motors.duty * interval / 100.0
+        time_in_mode[mode.name] = time_in_mode.get(mode.name, 0.0) + interval
+
+        energy.update(rover.motors.duty, sum(servo.attached for servo in rover.servos), now=t)
+        governor.update(energy.level)
+
+    return t, distance, time_in_mode
+
+def test_power_governor():
+    print("Simulating a long mission until the battery is empty...")
+    base_time, base_dist, _ = simulate(POWER_MODES[:1])
+    gov_time, gov_dist, modes = simulate(POWER_MODES)
+
+    print(f"Fixed (performance): runtime {base_time / 60:6.1f} min   distance {base_dist:8.0f}")
+    print(f"Power governor:      runtime {gov_time / 60:6.1f} min   distance {gov_dist:8.0f}")
+    print("Time per mode: " + ", ".join(f"{name} {secs / 60:.1f} min" for name, secs in modes.items()))
+    print(f"Runtime per charge: +{(gov_time / base_time - 1) * 100:.1f}%")
+
+    assert gov_time > base_time * 1.10
+
+if __name__ == "__main__":
+    test_power_governor()
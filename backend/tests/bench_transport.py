@@ -0,0 +1,99 @@
+import sys
+import os
+import time
+import socket
+import tempfile
+import statistics
+import subprocess
+
+import requests
+
+# Add project root to path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.append(ROOT)
+
+from pi_agent.transport import HttpTransport, UnixSocketTransport, backend_is_local
+
+TICKS = 500
+
+class RequestsTransport:
+    """The agent's previous path: requests.Session over TCP. Baseline only."""
+    def __init__(self, base_url):
+        self.base_url = base_url
+        self.session = requests.Session()
+
+    def request(self, method, path):
+        return self.session.request(method, f"{self.base_url}{path}", timeout=0.5).json()
+
+    def close(self):
+        self.session.close()
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_backend(port, socket_path):
+    env = dict(os.environ, BACKEND_HOST="127.0.0.1", BACKEND_PORT=str(port), BACKEND_SOCKET=socket_path)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "backend.main"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 15
+    while not backend_is_local(socket_path):
+        if time.time() > deadline or proc.poll() is not None:
+            proc.kill()
+            raise RuntimeError("Backend did not start")
+        time.sleep(0.1)
+    return proc
+
+def run_ticks(transport):
+    """Poll /api/drive like the agent does. Returns (latencies_us, cpu_us_per_tick)."""
+    for _ in range(50):  # warm up connection
+        transport.request("GET", "/api/drive")
+
+    latencies = []
+    cpu_start = time.process_time()
+    for _ in range(TICKS):
+        t0 = time.perf_counter()
+        transport.request("GET", "/api/drive")
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    cpu_per_tick = (time.process_time() - cpu_start) / TICKS * 1e6
+    return latencies, cpu_per_tick
+
+def report(name, latencies, cpu):
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{name:<22} median {statistics.median(latencies):8.1f} us   p99 {p99:8.1f} us   agent CPU {cpu:7.1f} us/tick")
+
+def test_transport():
+    print(f"Benchmarking command polling ({TICKS} ticks per transport)...")
+    port = free_port()
+    socket_path = os.path.join(tempfile.mkdtemp(), "smartfield-bench.sock")
+    proc = start_backend(port, socket_path)
+    try:
+        # Separates the two changes: requests -> stdlib client, then TCP -> Unix socket
+        transports = [
+            ("requests / TCP", RequestsTransport(f"http://127.0.0.1:{port}")),
+            ("stdlib / TCP", HttpTransport(f"http://127.0.0.1:{port}")),
+            ("stdlib / unix socket", UnixSocketTransport(socket_path)),
+        ]
+        results = {}
+        for name, transport in transports:
+            results[name] = run_ticks(transport)
+            transport.close()
+            report(name, *results[name])
+
+        tcp_lat, tcp_cpu = results["stdlib / TCP"]
+        uds_lat, uds_cpu = results["stdlib / unix socket"]
+        print(f"Unix socket vs stdlib TCP: CPU {uds_cpu / tcp_cpu:.2f}x, "
+              f"median latency {statistics.median(uds_lat) / statistics.median(tcp_lat):.2f}x")
+
+        assert statistics.median(uds_lat) < statistics.median(tcp_lat)
+        assert uds_cpu < tcp_cpu
+    finally:
+        proc.terminate()
+        proc.wait()
+
+if __name__ == "__main__":
+    test_transport()
@@ -0,0 +1,182 @@
+import sys
+import os
+import time
+import asyncio
+import resource
+import tempfile
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Keep the test database out of the working directory
+TMP_DIR = tempfile.mkdtemp()
+os.environ["HISTORY_DB"] = os.path.join(TMP_DIR, "history.db")
+os.environ["HISTORY_RETENTION_DAYS"] = "0"
+
+from fastapi.testclient import TestClient
+from backend.main import app
+from backend.state.system_state import state
+from backend.state.history import HistoryStore
+from backend.api.export import SENSOR_COLUMNS, encode_csv, encode_ndjson, encode_arrow, pa
+
+ROWS = 2_000_000
+MAX_RSS_GROWTH_MB = 64
+
+def peak_rss_mb():
+    # ru_maxrss is KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+START_TS = 1_700_000_000.0
+
+def fill(store):
+    metrics = ["soil.moisture", "soil.temperature", "soil.ph", "environment.humidity"]
+    start = START_TS
+    rows = ((start + i * 0.05, metrics[i % len(metrics)], float(i % 100)) for i in range(ROWS))
+    store.import_sensor_rows(rows)
+
+def drain(chunks):
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+    return total
+
+def test_export():
+    store = HistoryStore(os.path.join(TMP_DIR, "export.db"))
+    print(f"Writing {ROWS:,} sensor rows...")
+    fill(store)
+
+    encoders = [("csv", encode_csv), ("ndjson", encode_ndjson)]
+    if pa is not None:
+        schema = pa.schema([("ts", pa.float64()), ("metric", pa.string()), ("value", pa.float64())])
+        encoders.append(("arrow", lambda b, c: encode_arrow(b, c, schema)))
+
+    baseline = peak_rss_mb()
+    for name, encode in encoders:
+        t0 = time.time()
+        size = drain(encode(store.iter_sensor_readings(), SENSOR_COLUMNS))
+        growth = peak_rss_mb() - baseline
+        print(f"{name:<7} {size / 1e6:8.1f} MB in {time.time() - t0:5.1f}s   peak RSS +{growth:.1f} MB")
+        assert size > ROWS  # at least one byte per row actually streamed
+        assert growth < MAX_RSS_GROWTH_MB, f"{name} export is not streaming"
+
+    # Filters
+    count = sum(len(b) for b in store.iter_sensor_readings(metrics=["soil.ph"]))
+    assert count == ROWS // 4
+    count = sum(len(b) for b in store.iter_sensor_readings(start=1_700_000_000.0, end=1_700_000_010.0))
+    assert count == 200
+    print("Filters OK")
+
+def test_history_writer():
+    store = HistoryStore(os.path.join(TMP_DIR, "writer.db"), retention_days=1)
+    now = time.time()
+    store.record_command(now - 2 * 86400, 0, 50, 80)  # older than retention
+    store.record_command(now, 0, 60, 80)
+    store.record_sensors(now, {"soil": {"ph": 6.2, "label": "n/a"}})
+    store.flush()
+
+    # The writer prunes on its first batch, so the old command is already gone
+    assert [row[2] for b in store.iter_commands() for row in b] == [60]
+    assert sum(len(b) for b in store.iter_sensor_readings()) == 1  # non-numeric skipped
+    print("Background writer + retention OK")
+
+def test_metric_filter_escaping():
+    store = HistoryStore(os.path.join(TMP_DIR, "escape.db"))
+    store.import_sensor_rows([
+        (1.0, "soil.ph", 6.0), (2.0, "probe_1.ph", 6.1), (3.0, "probeX1.ph", 6.2), (4.0, "pct%.a", 1.0),
+    ])
+
+    def matched(*metrics):
+        return [row[1] for b in store.iter_sensor_readings(metrics=list(metrics)) for row in b]
+
+    # LIKE wildcards in a requested name must match literally
+    assert matched("so_l") == []
+    assert matched("%") == []
+    assert matched("probe_1") == ["probe_1.ph"]
+    assert matched("pct%") == ["pct%.a"]
+    print("Metric filter escaping OK")
+
+async def _asgi_get(path, query):
+    """
+    Call the app directly and discard each body chunk as it arrives.
+    TestClient collects the whole body in memory, which would hide whether
+    the endpoint really streams.
+    """
+    result = {"status": None, "size": 0, "chunks": 0, "headers": {}}
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": query.encode(), "root_path": "", "headers": [],
+        "server": ("testserver", 80), "client": ("testclient", 50000),
+    }
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            result["headers"] = {k.decode(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            result["size"] += len(message.get("body", b""))
+            result["chunks"] += 1
+            if not message.get("more_body", False):
+                disconnected.set()
+
+    await app(scope, receive, send)
+    return result
+
+def test_export_endpoints():
+    print(f"Writing {ROWS:,} sensor rows to the backend history...")
+    fill(state.history)
+    for i in range(10):
+        state.history.record_command(START_TS + i, 0, i * 10, 80)
+    state.history.flush()
+
+    # Large export through the real endpoint + StreamingResponse
+    baseline = peak_rss_mb()
+    for fmt in ["csv", "ndjson"] + (["arrow"] if pa is not None else []):
+        t0 = time.time()
+        result = asyncio.run(_asgi_get("/api/export/sensors", f"format={fmt}"))
+        growth = peak_rss_mb() - baseline
+        print(f"GET /api/export/sensors?format={fmt:<7} {result['size'] / 1e6:8.1f} MB in "
+              f"{result['chunks']} chunks, {time.time() - t0:5.1f}s   peak RSS +{growth:.1f} MB")
+        assert result["status"] == 200
+        assert "content-length" not in result["headers"]  # chunked transfer
+        assert result["chunks"] > 100
+        assert growth < MAX_RSS_GROWTH_MB, f"{fmt} endpoint is not streaming"
+
+    # Query parameters, small enough for TestClient
+    client = TestClient(app)
+    r = client.get("/api/export/sensors", params={
+        "format": "ndjson", "metrics": "soil.ph, environment",
+        "start": START_TS, "end": START_TS + 10,
+    })
+    assert r.status_code == 200
+    lines = r.text.splitlines()
+    # 200 rows in 10 s, half of them soil.ph or environment.*
+    assert len(lines) == 100
+    assert {line.split('"metric": "')[1].split('"')[0] for line in lines} == {"soil.ph", "environment.humidity"}
+
+    r = client.get("/api/export/sensors", params={"metrics": "soil", "start": START_TS, "end": START_TS + 1})
+    assert r.text.splitlines()[0] == "ts,metric,value"
+    assert len(r.text.splitlines()) == 1 + 15  # 20 rows in 1 s, 3 of 4 metrics are soil.*
+
+    r = client.get("/api/export/commands", params={"start": START_TS + 2, "end": START_TS + 5})
+    assert [line.split(",")[2] for line in r.text.splitlines()[1:]] == ["20", "30", "40"]
+
+    assert client.get("/api/export/sensors", params={"format": "xml"}).status_code == 422
+    assert client.get("/api/export/commands", params={"start": "yesterday"}).status_code == 422
+    print("Endpoint filters + validation OK")
+
+if __name__ == "__main__":
+    test_export()
+    test_history_writer()
+    test_metric_filter_escaping()
+    test_export_endpoints()
@@ -22,4 +22,27 @@ class RoverConfig(BaseSettings):
     # Motion Tuning
     JOYSTICK_DEADZONE: int = 5
 
+    # Backend Connection
+    # Remote backend (Laptop IP). Override with the BACKEND_URL env variable.
+    BACKEND_URL: str = "http://10.76.187.200:8000"
+    # If the backend runs on this Pi, it also listens here (see backend/config.py).
+    # The agent uses the socket when it exists, and falls back to BACKEND_URL.
+    BACKEND_SOCKET: str = "/tmp/smartfield-backend.sock"
+    REQUEST_TIMEOUT: float = 0.5
+
+    # Battery / Power Model (see rover/power.py)
+    # Default pack: 3S Li-ion 4000mAh.
+    BATTERY_CAPACITY_WH: float = 44.4
+    BATTERY_V_FULL: float = 12.6
+    BATTERY_V_EMPTY: float = 10.5
+    POWER_IDLE_W: float = 3.0        # Pi + Wi-Fi baseline
+    POWER_MOTOR_MAX_W: float = 60.0  # All motors at 100% duty
+    POWER_SERVO_W: float = 1.0       # Per attached (holding) servo
+    POWER_POLL_J: float = 0.02       # Radio + CPU cost per backend request
+    BATTERY_REPORT_INTERVAL: float = 5.0
+    # Energy used since the last full charge survives restarts here.
+    # After recharging, start the agent once with --battery-full.
+    BATTERY_STATE_FILE: str = "battery_state.json"
+    BATTERY_SAVE_INTERVAL: float = 60.0
+
 config = RoverConfig()
@@ -0,0 +1,87 @@
+import time
+import logging
+import threading
+
+from transport import TransportError, connect_backend
+
+class EStopListener(threading.Thread):
+    """
+    Dedicated emergency-stop channel.
+
+    Holds a long-poll on /api/estop/wait over its own connection, so a stop
+    reaches the motors as soon as the backend receives it: no waiting for the
+    drive poll interval (seconds in the low power modes) or behind a drive request.
+
+    The latch is only released by a release of the same stop id. A backend
+    that restarted (state back to id 0) cannot un-latch the rover.
+    """
+    WAIT_TIMEOUT = 10.0  # Server-side long-poll timeout (seconds)
+
+    def __init__(self, rover, base_url: str, socket_path: str):
+        super().__init__(name="estop-listener", daemon=True)
+        self.rover = rover
+        self.base_url = base_url
+        self.socket_path = socket_path
+        self.last_id = 0        # Id of the stop the rover is latched on
+        self.active = False     # Rover latched
+        self.seen = (0, False)  # Last (id, active) reported by the backend
+        self.pending_ack = None # Stop id whose ack hasn't reached the backend yet
+        self._running = True
+
+    def connect(self):
+        # Request timeout must outlast the long-poll
+        return connect_backend(self.base_url, self.socket_path, self.WAIT_TIMEOUT + 2.0)
+
+    def run(self):
+        transport = self.connect()
+        while self._running:
+            try:
+                # A lost ack is resent on the new connection before waiting again
+                self.send_ack(transport)
+                estop = transport.request(
+                    "GET",
+                    f"/api/estop/wait?since={self.seen[0]}&active={str(self.seen[1]).lower()}&timeout={self.WAIT_TIMEOUT}",
+                )
+                self.handle(estop, transport)
+            except TransportError as e:
+                logging.warning(f"E-Stop channel lost: {e}")
+                transport.close()
+                time.sleep(0.5)
+                transport = self.connect()
+        transport.close()
+
+    def handle(self, estop: dict, transport):
+        self.seen = (estop["id"], estop["active"])
+
+        if estop["active"]:
+            if estop["id"] != self.last_id or not self.active:
+                # Actuate first, talk later
+                self.rover.emergency_stop()
+                self.active = True
+                self.last_id = estop["id"]
+                self.pending_ack = estop["id"]
+                self.send_ack(transport)
+            return
+
+        if not self.active:
+            self.last_id = estop["id"]
+        elif estop["id"] == self.last_id:
+            self.rover.release_emergency_stop()
+            self.active = False
+        else:
+            # Backend lost our stop (restart). Stay latched and re-raise it so
+            # the operator sees it and can release it explicitly.
+            logging.warning(
+                f"🛑 Backend e-stop state reset (id {self.last_id} -> {estop['id']}). "
+                "Keeping rover stopped and re-raising the e-stop."
+            )
+            transport.request("POST", "/api/estop")
+
+    def send_ack(self, transport):
+        if self.pending_ack is None:
+            return
+        transport.request("POST", "/api/estop/ack", {"id": self.pending_ack})
+        self.pending_ack = None
+
+    def stop(self):
+        self._running = False
@@ -1,8 +1,8 @@
 import time
-import requests
 import logging
 import sys
 import os
+import signal
 
 # Setup Logging FIRST to capture import-time logs
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - [PI] - %(message)s', force=True)
@@ -11,23 +11,46 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - [PI] - %(message)s
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from rover.motion import rover
+from rover.power import EnergyEstimator, PowerGovernor
 from config import config
+from transport import TransportError, connect_backend
+from estop import EStopListener
 
 # Configuration
-# Hardcoded IP for convenience (Laptop IP)
-BACKEND_URL = "http://10.76.187.200:8000"
+BACKEND_URL = config.BACKEND_URL
+BACKEND_SOCKET = config.BACKEND_SOCKET
 POLL_INTERVAL = 0.05  # 20Hz
 
+def _handle_sigterm(signum, frame):
+    # systemd / kill: take the same shutdown path as Ctrl+C (motors off, battery state saved)
+    raise KeyboardInterrupt
+
 def main():
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     logging.info(f"Pi Agent Started. Backend: {BACKEND_URL}")
-    
-    # Use a Session for connection pooling (Keep-Alive) reduces CPU/Network load
-    session = requests.Session()
-    
+
+    # Unix socket if the backend runs on this Pi, TCP/HTTP (Keep-Alive) otherwise
+    transport = connect_backend(BACKEND_URL, BACKEND_SOCKET, config.REQUEST_TIMEOUT)
+    logging.info(f"Transport: {transport.name} ({transport})")
+
+    # Emergency stop runs on its own thread + connection, outside the drive poll
+    estop_listener = EStopListener(rover, BACKEND_URL, BACKEND_SOCKET)
+    estop_listener.start()
+
+    # Battery estimate from applied duty cycles; governor picks the power mode
+    energy = EnergyEstimator(state_file=config.BATTERY_STATE_FILE)
+    if "--battery-full" in sys.argv:
+        energy.reset()
+    if energy.level is None:
+        logging.warning("🔋 Battery level unknown. Run with --battery-full after recharging.")
+    governor = PowerGovernor(rover)
+
     last_processed_ts = 0
     last_heartbeat = time.time()
+    last_battery_report = 0
+    last_battery_save = time.time()
     last_active_time = time.time() # Track when we last corrected/moved
-    
+
     while True:
         try:
             # 1. Watchdog Check
@@ -36,44 +59,70 @@ def main():
 
             # 2. Poll Backend
             try:
-                # Use session instead of requests.get
-                response = session.get(f"{BACKEND_URL}/api/drive", timeout=0.5)
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    ts = data.get("ts", 0)
-                    
-                    if ts > last_processed_ts:
-                        x = data.get("x", 0)
-                        y = data.get("y", 0)
-                        speed = data.get("speed", 0)
-                        
-                        rover.process_command(x, y, speed)
-                        last_processed_ts = ts
-                        
-                        # If moving, mark as active
-                        if x != 0 or y != 0:
-                            last_active_time = time.time()
-                    else:
-                        # Idle Heartbeat (every 5s)
-                        if time.time() - last_heartbeat > 5.0:
-                            logging.info("❤️  Heartbeat: Connected. Idle...")
-                            last_heartbeat = time.time()
-                        
-            except requests.exceptions.RequestException as e:
+                energy.record_poll()
+                data = transport.request("GET", "/api/drive")
+
+                ts = data.get("ts", 0)
+
+                if ts > last_processed_ts:
+                    x = data.get("x", 0)
+                    y = data.get("y", 0)
+                    speed = data.get("speed", 0)
+
+                    rover.process_command(x, y, speed)
+                    last_processed_ts = ts
+
+                    # If moving, mark as active
+                    if x != 0 or y != 0:
+                        last_active_time = time.time()
+                else:
+                    # Idle Heartbeat (every 5s)
+                    if time.time() - last_heartbeat > 5.0:
+                        logging.info("❤️  Heartbeat: Connected. Idle...")
+                        last_heartbeat = time.time()
+
+            except TransportError as e:
                 logging.warning(f"Backend Connection Failed: {e}")
+                # Backend may have been started/stopped on this Pi; re-detect the channel
+                transport.close()
+                transport = connect_backend(BACKEND_URL, BACKEND_SOCKET, config.REQUEST_TIMEOUT)
+
+            # 3. Power Governor
+            energy.update(rover.motors.duty, sum(servo.attached for servo in rover.servos))
+            mode = governor.update(energy.level)
+
+            if time.time() - last_battery_report > config.BATTERY_REPORT_INTERVAL:
+                try:
+                    energy.record_poll()
+                    level = energy.level
+                    transport.request("POST", "/api/status/battery", {
+                        "level": None if level is None else round(level, 1),
+                        "voltage": energy.voltage,
+                        "power_w": round(energy.power_w, 2),
+                        "mode": mode.name,
+                    })
+                except TransportError as e:
+                    logging.debug(f"Battery report failed: {e}")
+                last_battery_report = time.time()
+
+            if time.time() - last_battery_save > config.BATTERY_SAVE_INTERVAL:
+                energy.save()
+                last_battery_save = time.time()
 
-            # 3. Adaptive Sleep (Smart Polling)
-            # If valid movement in last 2 seconds -> Fast Poll (20Hz)
-            # Else -> Slow Poll (2Hz) to save Wi-Fi/Battery
+            # 4. Adaptive Sleep (Smart Polling)
+            # If valid movement in last 2 seconds -> Fast Poll (20Hz in performance mode)
+            # Else -> Slow Poll (2Hz in performance mode) to save Wi-Fi/Battery
             if time.time() - last_active_time < 2.0:
-                time.sleep(0.05) # 20Hz (Active)
+                time.sleep(mode.active_interval)
             else:
-                time.sleep(0.5)  # 2Hz (Power Save)
+                time.sleep(mode.idle_interval)
 
         except KeyboardInterrupt:
             logging.info("Stopping Pi Agent...")
+            estop_listener.stop()
             rover.motors.stop()
+            energy.save()
+            transport.close()
             break
         except Exception as e:
             logging.error(f"Unexpected Error: {e}")
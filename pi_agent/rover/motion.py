@@ -1,5 +1,6 @@
 import time
 import logging
+import threading
 from pi_agent.config import config
 from .motor_driver import MotorDriver
 from .servo_controller import ServoController
@@ -17,6 +18,19 @@ class RoverMotion:
         
         self.last_cmd_time = time.time()
 
+        # Emergency stop is applied from the e-stop listener thread.
+        # The lock keeps a drive command from slipping in after the stop.
+        self._lock = threading.Lock()
+        self.estop_active = False
+
+        # Set by the power governor: hold servos at center while driving straight,
+        # or detach them to save power (wheels stay roughly straight unpowered).
+        self.servo_hold = True
+
+    @property
+    def servos(self):
+        return [self.servo_fl, self.servo_fr, self.servo_rl, self.servo_rr]
+
     def joystick_to_steering(self, x):
         """
         Convert turn intent (x) to servo angles for 4-Wheel Steering.
@@ -44,6 +58,12 @@ class RoverMotion:
         Y: Drive Motors (Forward/Backward)
         X: Steer Servos (Left/Right)
         """
+        with self._lock:
+            if self.estop_active:
+                return
+            self._apply_command(x, y)
+
+    def _apply_command(self, x: int, y: int):
         # Apply Deadzone
         if abs(y) < config.JOYSTICK_DEADZONE: y = 0
         if abs(x) < config.JOYSTICK_DEADZONE: x = 0
@@ -73,16 +93,42 @@ class RoverMotion:
             # Rear steering is inverted for tighter turning radius
             self.servo_rl.set_angle(rear)
             self.servo_rr.set_angle(rear)
-        else:
+        elif self.servo_hold:
             # If moving straight, center servos
             self.servo_fl.set_angle(90)
             self.servo_fr.set_angle(90)
             self.servo_rl.set_angle(90)
             self.servo_rr.set_angle(90)
+        else:
+            # Power save: re-center once, then let go
+            for servo in self.servos:
+                if servo.last_angle != 90:
+                    servo.set_angle(90)
+                elif servo.attached:
+                    servo.detach()
         
         # Logging (sparse)
         # logging.info(f"Cmd: x={x} y={y}")
 
+    def emergency_stop(self):
+        """
+        Stop motors immediately and latch: drive commands are ignored
+        until release_emergency_stop().
+        """
+        with self._lock:
+            self.estop_active = True
+            self.motors.stop()
+            self.servo_fl.detach()
+            self.servo_fr.detach()
+            self.servo_rl.detach()
+            self.servo_rr.detach()
+        logging.warning("🛑 EMERGENCY STOP applied.")
+
+    def release_emergency_stop(self):
+        with self._lock:
+            self.estop_active = False
+        logging.info("✅ Emergency stop released.")
+
     def check_watchdog(self):
         """
         Check if too much time has passed since last command.
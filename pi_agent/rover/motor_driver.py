@@ -40,13 +40,18 @@ class MotorDriver:
         self.pwm.start(0)
 
         GPIO.output(config.MOTOR_DIR, GPIO.LOW)
+
+        # Speed cap (lowered by the power governor) and applied duty (for energy estimate)
+        self.max_speed = config.MAX_SPEED
+        self.duty = 0
         logging.info("MotorDriver (PWM+DIR) initialized.")
 
     def drive(self, speed: int):
         """
         speed: -100 to +100
         """
-        speed = max(-config.MAX_SPEED, min(config.MAX_SPEED, speed))
+        speed = max(-self.max_speed, min(self.max_speed, speed))
+        self.duty = abs(speed)
 
         if speed >= 0:
             GPIO.output(config.MOTOR_DIR, GPIO.HIGH)
@@ -61,6 +66,7 @@ class MotorDriver:
 
     def stop(self):
         self.pwm.ChangeDutyCycle(0)
+        self.duty = 0
         logging.info("🛑 [MOTORS] Stopped.")
 
     def cleanup(self):
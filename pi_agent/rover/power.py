@@ -0,0 +1,176 @@
+import os
+import json
+import time
+import logging
+from pi_agent.config import config
+
+class EnergyEstimator:
+    """
+    Estimates battery level by integrating the power the rover draws.
+
+    Power is modelled from what the agent actually applies:
+        P = idle + motor_max * duty + servo * attached_servos + poll_cost * polls/s
+    An optional voltage reader (e.g. an ADC channel) corrects the drift,
+    but only while the motors are near idle, since voltage sags under load.
+
+    Energy used is saved to `state_file` so a restart resumes from the real
+    pack state. Until the pack is calibrated (reset() after a full charge,
+    or a voltage reading), the level is unknown (None), never guessed.
+    """
+    VOLTAGE_BLEND = 0.05      # Weight of each voltage sample in the estimate
+    VOLTAGE_MAX_DUTY = 10     # Only trust voltage below this motor duty (%)
+
+    def __init__(self, voltage_reader=None, now: float = None, state_file: str = None):
+        self.capacity_wh = config.BATTERY_CAPACITY_WH
+        self.consumed_wh = None  # Unknown until calibrated
+        self.voltage_reader = voltage_reader
+        self.voltage = None
+        self.power_w = config.POWER_IDLE_W
+        self.last_update = time.time() if now is None else now
+        self.state_file = state_file
+        self._polls = 0
+        self.load()
+
+    @property
+    def level(self):
+        """Remaining charge in percent (0-100), or None if not calibrated."""
+        if self.consumed_wh is None:
+            return None
+        return max(0.0, min(100.0, 100.0 * (1 - self.consumed_wh / self.capacity_wh)))
+
+    def reset(self):
+        """Pack was just recharged: mark it full and save."""
+        self.consumed_wh = 0.0
+        self.save()
+        logging.info("🔋 Battery marked full.")
+
+    def load(self):
+        if not self.state_file or not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file) as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Battery state unreadable ({e}). Level unknown until recharge/reset.")
+            return
+        if saved.get("capacity_wh") != self.capacity_wh:
+            logging.warning("Battery capacity changed since last save. Level unknown until recharge/reset.")
+            return
+        self.consumed_wh = saved.get("consumed_wh")
+
+    def save(self):
+        """Atomic write, so a power cut mid-save cannot corrupt the state."""
+        if not self.state_file or self.consumed_wh is None:
+            return
+        tmp = f"{self.state_file}.tmp"
+        try:
+            with open(tmp, "w") as f:
+                json.dump({"consumed_wh": self.consumed_wh, "capacity_wh": self.capacity_wh, "saved_at": time.time()}, f)
+            os.replace(tmp, self.state_file)
+        except OSError as e:
+            logging.warning(f"Could not save battery state: {e}")
+
+    def record_poll(self):
+        self._polls += 1
+
+    def update(self, motor_duty: float, servos_attached: int, now: float = None):
+        """
+        Integrate energy since the last update, then set the new power draw.
+        motor_duty: 0-100 (% PWM), servos_attached: number of servos holding.
+        """
+        now = time.time() if now is None else now
+        dt = now - self.last_update
+        if dt <= 0:
+            return
+
+        poll_w = self._polls * config.POWER_POLL_J / dt
+        if self.consumed_wh is not None:
+            self.consumed_wh += (self.power_w + poll_w) * dt / 3600.0
+        self._polls = 0
+        self.last_update = now
+
+        self.power_w = (
+            config.POWER_IDLE_W
+            + config.POWER_MOTOR_MAX_W * motor_duty / 100.0
+            + config.POWER_SERVO_W * servos_attached
+        )
+
+        if self.voltage_reader and motor_duty < self.VOLTAGE_MAX_DUTY:
+            self._correct_from_voltage()
+
+    def _correct_from_voltage(self):
+        try:
+            self.voltage = self.voltage_reader()
+        except Exception as e:
+            logging.debug(f"Voltage read failed: {e}")
+            return
+        if self.voltage is None:
+            return
+
+        span = config.BATTERY_V_FULL - config.BATTERY_V_EMPTY
+        level_v = max(0.0, min(100.0, 100.0 * (self.voltage - config.BATTERY_V_EMPTY) / span))
+        if self.level is None:
+            level = level_v  # First reading calibrates the estimate
+        else:
+            level = (1 - self.VOLTAGE_BLEND) * self.level + self.VOLTAGE_BLEND * level_v
+        self.consumed_wh = self.capacity_wh * (1 - level / 100.0)
+
+class PowerMode:
+    def __init__(self, name, min_level, active_interval, idle_interval, max_speed, servo_hold, log_level):
+        self.name = name
+        self.min_level = min_level              # Battery % needed to stay in this mode
+        self.active_interval = active_interval  # Poll interval while driving (s)
+        self.idle_interval = idle_interval      # Poll interval while idle (s)
+        self.max_speed = max_speed              # Motor duty cap (%)
+        self.servo_hold = servo_hold            # Hold servos centered while driving straight
+        self.log_level = log_level
+
+# Highest to lowest. E-stop has its own channel, so slow polling never delays a stop.
+POWER_MODES = [
+    PowerMode("performance", 50, 0.05, 0.5, config.MAX_SPEED, True, logging.INFO),
+    PowerMode("balanced", 25, 0.1, 1.0, min(80, config.MAX_SPEED), True, logging.INFO),
+    PowerMode("eco", 10, 0.2, 2.0, min(60, config.MAX_SPEED), False, logging.WARNING),
+    PowerMode("critical", 0, 0.25, 3.0, min(40, config.MAX_SPEED), False, logging.WARNING),
+]
+
+class PowerGovernor:
+    """
+    Steps through POWER_MODES as the battery drains.
+    Hysteresis keeps it from flapping when the level hovers at a threshold.
+    """
+    HYSTERESIS = 5.0  # % above a mode's threshold needed to step back up
+    UNKNOWN_MODE_INDEX = 1  # "balanced" while the battery level is unknown
+
+    def __init__(self, rover, modes=POWER_MODES):
+        self.rover = rover
+        self.modes = modes
+        self.mode = None
+        self.apply(modes[0])
+
+    def update(self, level) -> PowerMode:
+        if level is None:
+            # Unknown charge: don't assume a full pack
+            return self._switch(self.modes[min(self.UNKNOWN_MODE_INDEX, len(self.modes) - 1)], "unknown")
+
+        index = self.modes.index(self.mode)
+
+        # Step down while below the current mode's floor
+        while index < len(self.modes) - 1 and level < self.modes[index].min_level:
+            index += 1
+        # Step up only with margin
+        while index > 0 and level >= self.modes[index - 1].min_level + self.HYSTERESIS:
+            index -= 1
+
+        return self._switch(self.modes[index], f"{level:.0f}%")
+
+    def _switch(self, mode: PowerMode, level_text: str) -> PowerMode:
+        if mode is not self.mode:
+            logging.warning(f"🔋 Battery {level_text}: power mode {self.mode.name} -> {mode.name}")
+            self.apply(mode)
+        return self.mode
+
+    def apply(self, mode: PowerMode):
+        self.mode = mode
+        self.rover.motors.max_speed = mode.max_speed
+        self.rover.servo_hold = mode.servo_hold
+        logging.getLogger().setLevel(mode.log_level)
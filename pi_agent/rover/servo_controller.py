@@ -21,6 +21,7 @@ class ServoController:
     def __init__(self, pin):
         self.pin = pin
         self.last_angle = -1
+        self.attached = False  # True while PWM is holding a position
         try:
             GPIO.setup(self.pin, GPIO.OUT)
             self.pwm = GPIO.PWM(self.pin, config.PWM_FREQ_SERVO)
@@ -35,7 +36,8 @@ class ServoController:
         angle = max(0, min(180, angle))
         
         # Anti-Jitter 1: Only update if angle changed significantly (> 1 degree)
-        if abs(angle - self.last_angle) < 1.0:
+        # A detached servo is always re-energised, even at the same angle.
+        if self.attached and abs(angle - self.last_angle) < 1.0:
             return
 
         self.last_angle = angle
@@ -46,6 +48,7 @@ class ServoController:
         # Map 0-180 to Duty Cycle
         duty = 2 + (angle / 18)
         self.pwm.ChangeDutyCycle(duty)
+        self.attached = True
         
         # Anti-Jitter 2: "Auto-Relax"
         # Since rpi-lgpio uses software PWM, the timing fluctuates (jitter)
@@ -56,3 +59,4 @@ class ServoController:
     def detach(self):
         """Stop sending PWM signal to eliminate jitter/buzzing when idle."""
         self.pwm.ChangeDutyCycle(0)
+        self.attached = False
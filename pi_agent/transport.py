@@ -0,0 +1,132 @@
+import json
+import os
+import socket
+import logging
+import http.client
+from urllib.parse import urlsplit
+
+
+class TransportError(Exception):
+    """Raised when the backend cannot be reached or returns an error."""
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that connects to a Unix domain socket instead of host:port."""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class _KeepAliveTransport:
+    """
+    One persistent stdlib HTTP/1.1 connection to the backend.
+    Far cheaper per poll than the requests stack; subclasses pick the socket.
+    """
+    name = None
+
+    def __init__(self, conn: http.client.HTTPConnection):
+        self.conn = conn
+
+    def request(self, method: str, path: str, payload: dict = None):
+        body = None
+        headers = {}
+        if payload is not None:
+            body = json.dumps(payload)
+            headers["Content-Type"] = "application/json"
+
+        # Second attempt covers a keep-alive connection the backend already closed.
+        for attempt in range(2):
+            try:
+                self.conn.request(method, path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                data = response.read()
+                break
+            except (OSError, http.client.HTTPException) as e:
+                # Drop the broken connection; the next request reconnects.
+                self.conn.close()
+                stale = isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError))
+                if attempt == 1 or not stale:
+                    raise TransportError(e) from e
+
+        if response.status != 200:
+            raise TransportError(f"HTTP {response.status} on {method} {path}")
+        try:
+            return json.loads(data)
+        except ValueError as e:
+            raise TransportError(f"Bad JSON on {method} {path}: {e}") from e
+
+    def close(self):
+        self.conn.close()
+
+
+class HttpTransport(_KeepAliveTransport):
+    """Talks to a remote backend over TCP/HTTP (Keep-Alive)."""
+    name = "tcp"
+
+    def __init__(self, base_url: str, timeout: float = 0.5):
+        self.base_url = base_url.rstrip("/")
+        url = urlsplit(self.base_url)
+        conn_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        super().__init__(conn_class(url.hostname, url.port, timeout=timeout))
+
+    def __str__(self):
+        return self.base_url
+
+
+class UnixSocketTransport(_KeepAliveTransport):
+    """
+    Talks to a backend on the same host over its Unix domain socket.
+    Skips the TCP/IP stack entirely.
+    """
+    name = "uds"
+
+    def __init__(self, socket_path: str, timeout: float = 0.5):
+        self.socket_path = socket_path
+        super().__init__(_UnixHTTPConnection(socket_path, timeout))
+
+    def __str__(self):
+        return f"unix:{self.socket_path}"
+
+
+def backend_is_local(socket_path: str) -> bool:
+    """
+    Check whether a backend is listening on the Unix socket.
+    A leftover socket file from a dead backend refuses connections, so probe it.
+    """
+    if not socket_path or not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return False
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(0.2)
+    try:
+        sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def connect_backend(base_url: str, socket_path: str, timeout: float = 0.5):
+    """
+    Pick the cheapest channel to the backend.
+    Co-located backend -> Unix socket. Remote backend -> TCP/HTTP.
+    """
+    if backend_is_local(socket_path):
+        transport = UnixSocketTransport(socket_path, timeout)
+    else:
+        transport = HttpTransport(base_url, timeout)
+
+    logging.debug(f"Backend transport: {transport.name} ({transport})")
+    return transport
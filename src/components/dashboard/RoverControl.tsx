@@ -1,29 +1,44 @@
 import { useState, useRef, useCallback } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
 import { VirtualJoystick } from './VirtualJoystick';
 import { RoverState } from '@/types/sensor';
 import { Slider } from '@/components/ui/slider';
 import { Button } from '@/components/ui/button';
 import { cn } from '@/lib/utils';
 import { api } from '@/services/api';
+import { toast } from '@/components/ui/sonner';
 import {
   Battery,
   Wifi,
   WifiOff,
   StopCircle,
+  RotateCcw,
   Gauge,
   Bot,
   CircleDot
 } from 'lucide-react';
 
+const ESTOP_ATTEMPTS = 3;
+const ESTOP_RETRY_MS = 100;
+
 interface RoverControlProps {
   roverState: RoverState;
 }
 
-export function RoverControl({ roverState: initialState }: RoverControlProps) {
-  const [roverState, setRoverState] = useState(initialState);
+export function RoverControl({ roverState }: RoverControlProps) {
+  // Connection and battery come live from /api/status; speed is the operator's local setting
+  const [speed, setSpeed] = useState(roverState.speed);
   const [joystickPosition, setJoystickPosition] = useState({ x: 0, y: 0 });
-  const [isEmergencyStop, setIsEmergencyStop] = useState(false);
   const lastSentRef = useRef<number>(0);
+  const queryClient = useQueryClient();
+
+  // The latch lives on the backend: it survives page reloads and is shared
+  // with every other dashboard, so never track it locally.
+  const isEmergencyStop = roverState.estop;
+
+  const setBackendEstop = useCallback((estop: unknown) => {
+    queryClient.setQueryData(['status'], (prev: any) => prev && { ...prev, estop });
+  }, [queryClient]);
 
   const handleJoystickMove = useCallback((position: { x: number; y: number }) => {
     if (isEmergencyStop) return;
@@ -35,26 +50,58 @@ export function RoverControl({ roverState: initialState }: RoverControlProps) {
       // Scale position (-1 to 1) to (-100 to 100)
       const x = Math.round(position.x * 100);
       const y = Math.round(position.y * 100);
-      const speed = roverState.speed;
-
       // Backend now handles steering automatically based on X
-      api.drive(x, y, speed);
+      api.drive(x, y, speed).then(result => {
+        if (!result?.estop) return;
+        // Latched elsewhere (another dashboard, or before this page loaded)
+        toast.error('Emergency stop active', {
+          id: 'estop-latched',
+          description: 'The rover ignores drive commands until the stop is released.',
+        });
+        queryClient.invalidateQueries({ queryKey: ['status'] });
+      });
       lastSentRef.current = now;
     }
-  }, [isEmergencyStop, roverState.speed]);
+  }, [isEmergencyStop, speed, queryClient]);
 
   const handleSpeedChange = (value: number[]) => {
-    setRoverState(prev => ({ ...prev, speed: value[0] }));
+    setSpeed(value[0]);
   };
 
-  const handleEmergencyStop = () => {
-    setIsEmergencyStop(true);
+  const handleEmergencyStop = async () => {
     setJoystickPosition({ x: 0, y: 0 });
-    // Reset after 2 seconds
-    setTimeout(() => setIsEmergencyStop(false), 2000);
+    // Priority lane: pushed straight to the Pi, bypassing the drive poll.
+    // Stays latched on the backend and the rover until the operator releases it.
+    // Only show STOPPED once the backend has confirmed the latch
+    for (let attempt = 0; attempt < ESTOP_ATTEMPTS; attempt++) {
+      if (attempt > 0) await new Promise(resolve => setTimeout(resolve, ESTOP_RETRY_MS));
+      const result = await api.emergencyStop();
+      if (result) {
+        setBackendEstop(result);
+        return;
+      }
+    }
+
+    // Not latched: at least zero the drive command so the rover halts on its next poll
+    const halted = await api.drive(0, 0, 0);
+    toast.error('Emergency stop failed', {
+      description: halted
+        ? 'The stop could not be latched. A zero drive command was sent instead; press again to latch.'
+        : 'Backend unreachable. The rover may still be moving.',
+    });
+  };
+
+  const handleReleaseEmergencyStop = async () => {
+    const result = await api.releaseEmergencyStop();
+    if (result) {
+      setBackendEstop(result);
+    } else {
+      toast.error('Release failed', { description: 'The rover stays stopped. Try again.' });
+    }
   };
 
   const getBatteryColor = () => {
+    if (roverState.battery === null) return 'text-muted-foreground';
     if (roverState.battery > 50) return 'text-status-optimal';
     if (roverState.battery > 20) return 'text-status-warning';
     return 'text-status-critical';
@@ -92,7 +139,7 @@ export function RoverControl({ roverState: initialState }: RoverControlProps) {
             <div>
               <p className="text-xs text-muted-foreground">Battery</p>
               <p className={cn('text-sm font-medium', getBatteryColor())}>
-                {roverState.battery}%
+                {roverState.battery === null ? 'Unknown' : `${roverState.battery}%`}
               </p>
             </div>
           </div>
@@ -115,12 +162,12 @@ export function RoverControl({ roverState: initialState }: RoverControlProps) {
           <Gauge className="w-5 h-5 text-primary" />
           <h3 className="font-display font-semibold text-foreground">Speed Control</h3>
           <span className="ml-auto text-sm font-medium text-primary">
-            {roverState.speed}%
+            {speed}%
           </span>
         </div>
 
         <Slider
-          value={[roverState.speed]}
+          value={[speed]}
           onValueChange={handleSpeedChange}
           max={100}
           step={10}
@@ -149,6 +196,19 @@ export function RoverControl({ roverState: initialState }: RoverControlProps) {
         {isEmergencyStop ? 'STOPPED' : 'EMERGENCY STOP'}
       </Button>
 
+      {isEmergencyStop && (
+        <Button
+          variant="outline"
+          size="lg"
+          className="w-full"
+          onClick={handleReleaseEmergencyStop}
+          disabled={!roverState.connected}
+        >
+          <RotateCcw className="w-5 h-5 mr-2" />
+          Release Emergency Stop
+        </Button>
+      )}
+
       {/* Position Display */}
       <div className="bg-card rounded-xl border border-border p-4">
         <div className="flex items-center gap-2 mb-3">
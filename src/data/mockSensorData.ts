@@ -139,6 +139,7 @@ export const getAISuggestions = (cropType: CropType, sensorData: SensorData[]):
 export const mockRoverState: RoverState = {
   connected: true,
   battery: 78,
+  estop: false,
   speed: 50,
   position: { x: 0, y: 0 },
 };
@@ -120,7 +120,8 @@ const Index = () => {
   // Map status to RoverState
   const roverState: RoverState = useMemo(() => ({
     connected: rawStatus?.connection === 'online',
-    battery: rawStatus?.battery ?? 0,
+    battery: rawStatus ? rawStatus.battery : 0,
+    estop: rawStatus?.estop?.active ?? false,
     speed: 50, // This is local control state mainly, but could come from backend if two-way
     position: { x: 0, y: 0 }
   }), [rawStatus]);
@@ -13,6 +13,9 @@ export const api = {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ x, y, speed, servos }),
             });
+            // 409: the backend has an emergency stop latched and refused the command
+            if (response.status === 409) return { estop: true };
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
             return await response.json();
         } catch (error) {
             console.error('Drive API Error:', error);
@@ -20,6 +23,28 @@ export const api = {
         }
     },
 
+    emergencyStop: async () => {
+        try {
+            const response = await fetch(`${BASE_URL}/estop`, { method: 'POST' });
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return await response.json();
+        } catch (error) {
+            console.error('E-Stop API Error:', error);
+            return null;
+        }
+    },
+
+    releaseEmergencyStop: async () => {
+        try {
+            const response = await fetch(`${BASE_URL}/estop/release`, { method: 'POST' });
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            return await response.json();
+        } catch (error) {
+            console.error('E-Stop Release API Error:', error);
+            return null;
+        }
+    },
+
     getSensors: async () => {
         try {
             const controller = new AbortController();
@@ -41,13 +41,15 @@ export interface AISuggestion {
 
 export interface RoverState {
   connected: boolean;
-  battery: number;
+  battery: number | null;
+  estop: boolean;
   speed: number;
   position: { x: number; y: number };
 }
 export interface RoverState {
   connected: boolean;
-  battery: number;
+  battery: number | null;
+  estop: boolean;
   speed: number;
   position: { x: number; y: number };
 }